@@ -0,0 +1,220 @@
+import argparse
+import gzip
+import hashlib
+import json
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from dotenv import load_dotenv
+
+import db
+
+# API HTTP somente-leitura (JSON) para ferramentas externas: impressão de binders, rastreador de preços etc.
+# Expõe os mesmos dados de get_lists_with_counts, get_cards_for_list e search_cards.
+#
+#   GET /lists                      -> listas com total de cards
+#   GET /lists/<id>/cards           -> cards da lista, na ordem de exibição
+#   GET /cards/search?name=pika     -> busca (filtros: name, language, status, condition, min_note, max_note, sort)
+#
+# HEAD é aceito em todas as rotas, com os mesmos cabeçalhos do GET.
+# Parâmetros comuns: limit (padrão 100, máx. 500), offset, fields=id,name,... (projeção de campos).
+# As respostas trazem ETag derivado da versão de cada lista (scripts/migration_11.sql); com If-None-Match
+# o cliente recebe 304 sem que os cards sejam consultados novamente.
+#
+# Uso: python api.py --host 127.0.0.1 --port 8502
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 500
+GZIP_MIN_BYTES = 1024
+
+LIST_FIELDS = ("id", "name", "total_cards")
+CARD_FIELDS = ("id", "name", "photo_url", "card_number", "collection_total", "language", "card_order", "grading_note", "condition", "owned")
+SEARCH_FIELDS = ("name", "photo_url", "card_number", "collection_total", "language", "list_name", "id", "grading_note", "condition", "owned")
+
+SEARCH_FILTERS = ("name", "language", "status", "condition", "min_note", "max_note", "sort")
+
+
+class ApiError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _int_param(query: dict, name: str, default: int | None, minimum: int = 0, maximum: int | None = None) -> int | None:
+    values = query.get(name)
+    if not values or values[0] == "":
+        return default
+    try:
+        value = int(values[0])
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"Parâmetro '{name}' deve ser um número inteiro.")
+    if value < minimum or (maximum is not None and value > maximum):
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"Parâmetro '{name}' fora do intervalo permitido.")
+    return value
+
+
+def _fields_param(query: dict, available: tuple[str, ...]) -> tuple[str, ...]:
+    values = query.get("fields")
+    if not values or values[0] == "":
+        return available
+    fields = tuple(f.strip() for f in values[0].split(",") if f.strip())
+    unknown = [f for f in fields if f not in available]
+    if unknown:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"Campos desconhecidos: {', '.join(unknown)}. Disponíveis: {', '.join(available)}.")
+    return fields
+
+
+def _etag(*parts) -> str:
+    # Fraco (W/): o mesmo conteúdo pode ser servido com ou sem gzip
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or etag[2:] in candidates
+
+
+def _page(rows: list, columns: tuple[str, ...], fields: tuple[str, ...], limit: int, offset: int) -> dict:
+    # As consultas buscam limit + 1 linhas só para saber se existe próxima página
+    has_more = len(rows) > limit
+    indexes = [columns.index(f) for f in fields]
+    return {
+        "items": [{f: row[i] for f, i in zip(fields, indexes)} for row in rows[:limit]],
+        "limit": limit,
+        "offset": offset,
+        "next_offset": offset + limit if has_more else None,
+    }
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = "PokelistAPI/1.0"
+
+    def do_GET(self):
+        self._handle(send_body=True)
+
+    def do_HEAD(self):
+        # Mesmos status e cabeçalhos do GET (ETag, Content-Length), sem o corpo
+        self._handle(send_body=False)
+
+    def _handle(self, send_body: bool):
+        self.send_body = send_body
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        segments = [s for s in url.path.split("/") if s]
+        try:
+            limit = _int_param(query, "limit", DEFAULT_LIMIT, minimum=1, maximum=MAX_LIMIT)
+            offset = _int_param(query, "offset", 0)
+            if segments == ["lists"]:
+                self._lists(query, limit, offset)
+            elif len(segments) == 3 and segments[0] == "lists" and segments[2] == "cards":
+                if not segments[1].isdigit():
+                    raise ApiError(HTTPStatus.NOT_FOUND, "Lista não encontrada.")
+                self._list_cards(int(segments[1]), query, limit, offset)
+            elif segments == ["cards", "search"]:
+                self._search(query, limit, offset)
+            else:
+                raise ApiError(HTTPStatus.NOT_FOUND, "Recurso não encontrado.")
+        except ApiError as e:
+            self._send_json(e.status, {"error": e.message})
+        except Exception as e:
+            self.log_error("Erro ao atender %s: %s", self.path, e)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Erro interno."})
+
+    def _lists(self, query, limit, offset):
+        fields = _fields_param(query, LIST_FIELDS)
+        etag = _etag("lists", db.get_list_versions(), fields, limit, offset)
+        if self._not_modified(etag):
+            return
+        rows = db.get_lists_with_counts(limit=limit + 1, offset=offset)
+        self._send_json(HTTPStatus.OK, _page(rows, LIST_FIELDS, fields, limit, offset), etag)
+
+    def _list_cards(self, list_id, query, limit, offset):
+        fields = _fields_param(query, CARD_FIELDS)
+        version = db.get_list_version(list_id)
+        if version is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, "Lista não encontrada.")
+        etag = _etag("cards", list_id, version, fields, limit, offset)
+        if self._not_modified(etag):
+            return
+        rows = db.get_cards_for_list(list_id, limit=limit + 1, offset=offset)
+        self._send_json(HTTPStatus.OK, _page(rows, CARD_FIELDS, fields, limit, offset), etag)
+
+    def _search(self, query, limit, offset):
+        fields = _fields_param(query, SEARCH_FIELDS)
+        filters = {name: query[name][0] for name in SEARCH_FILTERS if query.get(name) and query[name][0] != ""}
+        if filters.get("status") not in (None, "owned", "wish"):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Parâmetro 'status' deve ser 'owned' ou 'wish'.")
+        if filters.get("sort") not in (None, "name", "number", "grade_desc"):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Parâmetro 'sort' deve ser 'name', 'number' ou 'grade_desc'.")
+        min_note = _int_param(query, "min_note", None, minimum=1, maximum=10)
+        max_note = _int_param(query, "max_note", None, minimum=1, maximum=10)
+        # A busca cruza todas as listas, então o ETag depende da versão de todas elas
+        etag = _etag("search", db.get_list_versions(), sorted(filters.items()), fields, limit, offset)
+        if self._not_modified(etag):
+            return
+        rows = db.search_cards(
+            name_term=filters.get("name"),
+            language=filters.get("language"),
+            status=filters.get("status"),
+            condition=filters.get("condition"),
+            min_note=min_note,
+            max_note=max_note,
+            sort=filters.get("sort", "name"),
+            limit=limit + 1,
+            offset=offset,
+        )
+        self._send_json(HTTPStatus.OK, _page(rows, SEARCH_FIELDS, fields, limit, offset), etag)
+
+    def _not_modified(self, etag: str) -> bool:
+        if not _etag_matches(self.headers.get("If-None-Match"), etag):
+            return False
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        return True
+
+    def _send_json(self, status: HTTPStatus, payload: dict, etag: str | None = None):
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        gzipped = len(body) >= GZIP_MIN_BYTES and "gzip" in (self.headers.get("Accept-Encoding") or "")
+        if gzipped:
+            body = gzip.compress(body, compresslevel=5)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Vary", "Accept-Encoding")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if self.send_body:
+            self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API HTTP somente-leitura das listas e cards.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args()
+
+    load_dotenv()
+    server = ThreadingHTTPServer((args.host, args.port), ApiHandler)
+    print(f"API disponível em http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,9 @@
 import streamlit as st
-import psycopg2
-import os
-from dotenv import load_dotenv
+from bootstrap import setup_page
+from db import get_db_connection
 
 # --- Configuração Inicial e Funções de DB ---
-load_dotenv()
-st.set_page_config(layout="wide")
-
-def get_db_connection():
-    return psycopg2.connect(os.getenv("DATABASE_URL"))
+setup_page(layout="wide")
 
 # --- Funções da Página ---
 def handle_list_rename(list_id, new_name):
@@ -0,0 +1,56 @@
+import os
+from functools import cache
+
+import streamlit as st
+from dotenv import load_dotenv
+
+# Configuração compartilhada pelas páginas.
+# O Streamlit reexecuta o script inteiro a cada interação; o que não depende da sessão
+# (variáveis de ambiente, CSS, cliente do Cloudinary) é preparado uma única vez por processo.
+
+# Empilha as colunas em telas menores
+RESPONSIVE_CSS = """
+@media (max-width: 900px) {
+    div[data-testid="column"] { width: 100% !important; flex: 1 0 100% !important; min-width: 0 !important; }
+    div[data-testid="stHorizontalBlock"] { gap: 0.5rem !important; }
+    .block-container { padding-left: 0.75rem; padding-right: 0.75rem; }
+}
+"""
+
+# Esconde a navegação padrão da pasta pages
+HIDE_SIDEBAR_NAV_CSS = """
+[data-testid="stSidebarNav"] { display: none !important; }
+"""
+
+
+@cache
+def load_env():
+    load_dotenv()
+
+
+@cache
+def _style_tag(css_blocks: tuple[str, ...]) -> str:
+    return "<style>" + "\n".join(css_blocks) + "</style>"
+
+
+def setup_page(*css_blocks: str, **page_config):
+    # Deve ser a primeira chamada do Streamlit no script (exigência do st.set_page_config)
+    load_env()
+    st.set_page_config(**page_config)
+    if css_blocks:
+        st.markdown(_style_tag(css_blocks), unsafe_allow_html=True)
+
+
+@cache
+def get_uploader():
+    # Importado e configurado só quando um upload acontece de fato
+    import cloudinary
+    import cloudinary.uploader
+
+    load_env()
+    cloudinary.config(
+        cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
+        api_key=os.getenv("CLOUDINARY_API_KEY"),
+        api_secret=os.getenv("CLOUDINARY_API_SECRET")
+    )
+    return cloudinary.uploader
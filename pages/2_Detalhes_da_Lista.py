@@ -1,34 +1,9 @@
 import streamlit as st
-import psycopg2
-import os
-from dotenv import load_dotenv
-import cloudinary
-import cloudinary.uploader
+from bootstrap import RESPONSIVE_CSS, setup_page, get_uploader
+from db import get_backend, get_db_connection, get_cards_for_list, get_lists_with_counts, find_owned_copies, transfer_cards
 
 # --- Configuração e Funções de DB ---
-load_dotenv()
-st.set_page_config(layout="wide")
-st.markdown(
-    """
-    <style>
-    @media (max-width: 900px) {
-        div[data-testid=\"column\"] { width: 100% !important; flex: 1 0 100% !important; min-width: 0 !important; }
-        div[data-testid=\"stHorizontalBlock\"] { gap: 0.5rem !important; }
-        .block-container { padding-left: 0.75rem; padding-right: 0.75rem; }
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
-
-def get_db_connection():
-    return psycopg2.connect(os.getenv("DATABASE_URL"))
-
-cloudinary.config(
-    cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
-    api_key=os.getenv("CLOUDINARY_API_KEY"),
-    api_secret=os.getenv("CLOUDINARY_API_SECRET")
-)
+setup_page(RESPONSIVE_CSS, layout="wide")
 
 LANGUAGES = [
     "Português", "Inglês", "Japonês", "Italiano", "Espanhol",
@@ -40,6 +15,9 @@ CARD_TYPES = [
 ]
 
 def ensure_card_type_column():
+    if get_backend() == "sqlite":
+        # O esquema do SQLite (scripts/sqlite_schema.sql) já nasce com a coluna card_type
+        return
     try:
         conn = get_db_connection()
         cur = conn.cursor()
@@ -66,6 +44,28 @@ def ensure_card_type_column():
         # Se falhar, seguimos sem interromper a UX; o INSERT ainda pode falhar e mostrará o erro
         pass
 
+def add_card(list_id, card_name, uploaded_file, card_number, collection_total, language, condition, grading_note, owned, card_type):
+    try:
+        ensure_card_type_column()
+        uploaded_file.seek(0)
+        upload_result = get_uploader().upload(uploaded_file)
+        photo_url = upload_result['secure_url']
+
+        conn = get_db_connection()
+        cur = conn.cursor()
+        # Insere o card com a próxima ordem disponível
+        cur.execute(
+            "INSERT INTO cards (name, photo_url, card_number, collection_total, language, list_id, card_order, condition, grading_note, owned, card_type) VALUES (%s, %s, %s, %s, %s, %s, (SELECT COALESCE(MAX(card_order), 0) + 1 FROM cards WHERE list_id = %s), %s, %s, %s, %s)",
+            (card_name, photo_url, card_number, collection_total, language, list_id, list_id, condition, grading_note, owned, card_type)
+        )
+        conn.commit()
+        cur.close()
+        conn.close()
+        st.success(f'Card "{card_name}" adicionado!')
+        st.rerun()
+    except Exception as e:
+        st.error(f"Ocorreu um erro: {e}")
+
 # --- Verificação de Estado ---
 if 'current_list_id' not in st.session_state:
     st.error("Nenhuma lista selecionada!")
@@ -76,16 +76,12 @@ if 'current_list_id' not in st.session_state:
 list_id = st.session_state['current_list_id']
 list_name = st.session_state['current_list_name']
 
-# --- Funções da Página ---
-def get_cards_for_list(list_id):
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT id, name, photo_url, card_number, collection_total, language, card_order, grading_note, condition, owned FROM cards WHERE list_id = %s ORDER BY card_order ASC", (list_id,))
-    cards = cur.fetchall()
-    cur.close()
-    conn.close()
-    return cards
+# Descarta a confirmação de card repetido pendente de outra lista
+if st.session_state.get('pending_card', {}).get('list_id', list_id) != list_id:
+    st.session_state.pop('pending_card', None)
+    st.session_state.pop('pending_card_copies', None)
 
+# --- Funções da Página ---
 def swap_card_order(card1_id, card1_order, card2_id, card2_order):
     try:
         conn = get_db_connection()
@@ -127,6 +123,14 @@ def update_card(card_id, name, card_number, collection_total, language, conditio
     except Exception as e:
         st.error(f"Erro ao atualizar: {e}")
 
+def apply_transfer(card_ids, source_list_id, target_list_id, copy=False):
+    try:
+        transferred = transfer_cards(card_ids, source_list_id, target_list_id, copy=copy)
+        st.success(f"{transferred} card(s) {'copiado(s)' if copy else 'movido(s)'}!")
+        st.rerun()
+    except Exception as e:
+        st.error(f"Erro ao {'copiar' if copy else 'mover'} os cards: {e}")
+
 # --- Título da Página ---
 st.title(f"Cards da Lista: {list_name}")
 # Voltar para a página principal de gerenciamento (app.py)
@@ -218,6 +222,36 @@ else:
                         swap_card_order(card_id, order, next_card[0], next_card[6])
         st.markdown("---")
 
+# --- Mover / Copiar Cards em Lote ---
+if cards:
+    with st.expander("Mover ou Copiar Cards para Outra Lista"):
+        try:
+            target_lists = [(other_id, other_name) for other_id, other_name, _ in get_lists_with_counts() if other_id != list_id]
+        except Exception as e:
+            target_lists = []
+            st.error(f"Não foi possível buscar as listas: {e}")
+
+        if not target_lists:
+            st.info("Crie outra lista para poder mover ou copiar cards.")
+        else:
+            card_labels = {
+                card[0]: f"{card[1]} — {card[3]}/{card[4]}" if card[4] else f"{card[1]} — {card[3]}"
+                for card in cards
+            }
+            target_names = dict(target_lists)
+            with st.form(key="transfer_cards_form"):
+                select_all = st.checkbox(f"Todos os cards da lista ({len(card_labels)})")
+                selected_card_ids = st.multiselect("Cards", options=list(card_labels.keys()), format_func=card_labels.get)
+                target_list_id = st.selectbox("Lista de destino", options=list(target_names.keys()), format_func=target_names.get)
+                operation = st.radio("Operação", options=["Mover", "Copiar"], horizontal=True)
+                if st.form_submit_button("Aplicar"):
+                    if select_all:
+                        selected_card_ids = list(card_labels.keys())
+                    if selected_card_ids:
+                        apply_transfer(selected_card_ids, list_id, target_list_id, copy=operation == "Copiar")
+                    else:
+                        st.warning("Selecione ao menos um card.")
+
 # --- Formulário para Adicionar Novo Card à Lista ---
 with st.expander("Adicionar Novo Card à Lista"):
     with st.form(key="add_card_form", clear_on_submit=True):
@@ -242,24 +276,43 @@ with st.expander("Adicionar Novo Card à Lista"):
         submitted = st.form_submit_button("Adicionar Card")
         if submitted:
             if uploaded_file and card_name and card_number:
-                try:
-                    ensure_card_type_column()
-                    upload_result = cloudinary.uploader.upload(uploaded_file)
-                    photo_url = upload_result['secure_url']
-
-                    conn = get_db_connection()
-                    cur = conn.cursor()
-                    # Insere o card com a próxima ordem disponível
-                    cur.execute(
-                        "INSERT INTO cards (name, photo_url, card_number, collection_total, language, list_id, card_order, condition, grading_note, owned, card_type) VALUES (%s, %s, %s, %s, %s, %s, (SELECT COALESCE(MAX(card_order), 0) + 1 FROM cards WHERE list_id = %s), %s, %s, %s, %s)",
-                        (card_name, photo_url, card_number, collection_total, language, list_id, list_id, condition, grading_note, owned, card_type)
-                    )
-                    conn.commit()
-                    cur.close()
-                    conn.close()
-                    st.success(f'Card "{card_name}" adicionado!')
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"Ocorreu um erro: {e}")
+                new_card = {
+                    "list_id": list_id,
+                    "card_name": card_name,
+                    "uploaded_file": uploaded_file,
+                    "card_number": card_number,
+                    "collection_total": collection_total,
+                    "language": language,
+                    "condition": condition,
+                    "grading_note": grading_note,
+                    "owned": owned,
+                    "card_type": card_type,
+                }
+                copies = find_owned_copies(card_name, card_number, collection_total, language, card_type)
+                if copies:
+                    # Guarda o card para confirmação antes de enviar a imagem ao Cloudinary
+                    st.session_state['pending_card'] = new_card
+                    st.session_state['pending_card_copies'] = copies
+                else:
+                    add_card(**new_card)
             else:
                 st.warning("Por favor, preencha todos os campos obrigatórios e envie uma imagem.")
+
+    # --- Confirmação de Card Repetido ---
+    pending_card = st.session_state.get('pending_card')
+    if pending_card:
+        copies = st.session_state.get('pending_card_copies', [])
+        total_copies = sum(count for _, count in copies)
+        list_names = ", ".join(name for name, _ in copies)
+        st.warning(f'Você já tem {total_copies} cópia(s) de "{pending_card["card_name"]}" nas listas: {list_names}.')
+        confirm_col, cancel_col = st.columns(2)
+        with confirm_col:
+            if st.button("Adicionar mesmo assim", key="confirm_pending_card"):
+                st.session_state.pop('pending_card', None)
+                st.session_state.pop('pending_card_copies', None)
+                add_card(**pending_card)
+        with cancel_col:
+            if st.button("Cancelar", key="cancel_pending_card"):
+                st.session_state.pop('pending_card', None)
+                st.session_state.pop('pending_card_copies', None)
+                st.rerun()
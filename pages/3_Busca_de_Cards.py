@@ -1,26 +1,9 @@
 import streamlit as st
-import psycopg2
-import os
-from dotenv import load_dotenv
+from bootstrap import RESPONSIVE_CSS, setup_page
+from db import search_cards
 
 # --- Configuração Inicial e Funções de DB ---
-load_dotenv()
-st.set_page_config(layout="wide")
-st.markdown(
-    """
-    <style>
-    @media (max-width: 900px) {
-        div[data-testid=\"column\"] { width: 100% !important; flex: 1 0 100% !important; min-width: 0 !important; }
-        div[data-testid=\"stHorizontalBlock\"] { gap: 0.5rem !important; }
-        .block-container { padding-left: 0.75rem; padding-right: 0.75rem; }
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
-
-def get_db_connection():
-    return psycopg2.connect(os.getenv("DATABASE_URL"))
+setup_page(RESPONSIVE_CSS, layout="wide")
 
 # --- Título da Página ---
 st.title("Busca de Cards na Coleção")
@@ -35,24 +18,9 @@ if search_term:
         st.image(image_url, caption=card_name, width="stretch")
 
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-        
-        # A busca será case-insensitive com o uso de ILIKE
-        query = """
-            SELECT c.name, c.photo_url, c.card_number, c.collection_total, c.language, l.name, c.id, c.grading_note, c.condition, c.owned
-            FROM cards c
-            JOIN lists l ON c.list_id = l.id
-            WHERE c.name ILIKE %s
-            ORDER BY l.name, c.name;
-        """
-        cur.execute(query, (f'%{search_term}%',))
-        
-        results = cur.fetchall()
-        
-        cur.close()
-        conn.close()
-        
+        # A busca é case-insensitive (ILIKE no PostgreSQL, FTS5 no SQLite)
+        results = search_cards(search_term)
+
         if not results:
             st.info(f'Nenhum card encontrado com o nome "{search_term}".')
         else:
@@ -0,0 +1,127 @@
+import argparse
+import http.client
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+
+from dotenv import load_dotenv
+
+import db
+
+# Verificação em segundo plano das fotos dos cards (cards.photo_url).
+# Faz requisições HEAD concorrentes num pool de threads limitado, com limite de requisições por segundo,
+# e grava status e tamanho em photo_checks (scripts/migration_12.sql). As páginas exibem um aviso no lugar
+# das fotos quebradas sem que o navegador precise tentar carregá-las.
+#
+# É incremental e pode ser interrompido: só verifica fotos nunca verificadas ou verificadas há mais de
+# --max-age-hours, e grava os resultados em lotes à medida que chegam.
+#
+# Uso (ex.: via cron): python photo_health.py --workers 8 --rate 10 --max-age-hours 24
+
+USER_AGENT = "PokelistPhotoHealth/1.0"
+SAVE_BATCH_SIZE = 25
+
+
+class RateLimiter:
+    # Distribui o início das requisições entre as threads: no máximo `rate` por segundo
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _content_length(headers) -> int | None:
+    # Em respostas a Range, o tamanho total vem em Content-Range: bytes 0-0/12345
+    content_range = headers.get("Content-Range") or ""
+    if "/" in content_range and content_range.rsplit("/", 1)[1].isdigit():
+        return int(content_range.rsplit("/", 1)[1])
+    value = headers.get("Content-Length")
+    return int(value) if value and value.isdigit() else None
+
+
+def check_photo(url: str, timeout: float = 10.0):
+    # Retorna (status_code, content_length, error); status_code None quando não houve resposta HTTP
+    method, headers = "HEAD", {"User-Agent": USER_AGENT}
+    for _ in range(2):
+        try:
+            # Dentro do try: URL malformada (sem esquema, com espaço...) é registrada como erro dessa foto
+            request = urllib.request.Request(url, method=method, headers=headers)
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return response.status, _content_length(response.headers), None
+        except urllib.error.HTTPError as e:
+            if e.code == 405 and method == "HEAD":
+                # Servidor sem suporte a HEAD: pede só o primeiro byte
+                method, headers = "GET", {**headers, "Range": "bytes=0-0"}
+                continue
+            return e.code, _content_length(e.headers), None
+        except (urllib.error.URLError, http.client.HTTPException, OSError, ValueError) as e:
+            return None, None, str(getattr(e, "reason", e))
+    return None, None, "Sem resposta"
+
+
+def scan_photos(workers: int = 8, rate: float = 10.0, max_age_hours: float = 24.0, limit: int | None = None, timeout: float = 10.0):
+    # Retorna quantas fotos foram verificadas
+    now = datetime.now(timezone.utc)
+    checked_before = (now - timedelta(hours=max_age_hours)).strftime("%Y-%m-%d %H:%M:%S")
+    urls = db.get_photo_urls_to_check(checked_before, limit)
+    if not urls:
+        return 0
+
+    limiter = RateLimiter(rate)
+
+    def task(url):
+        limiter.wait()
+        status_code, content_length, error = check_photo(url, timeout)
+        checked_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        return url, status_code, content_length, error, checked_at
+
+    checked = 0
+    pending = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(task, url) for url in urls]
+        try:
+            for future in as_completed(futures):
+                pending.append(future.result())
+                if len(pending) >= SAVE_BATCH_SIZE:
+                    db.save_photo_checks(pending)
+                    checked += len(pending)
+                    pending = []
+        finally:
+            # Em caso de interrupção, os resultados já obtidos são gravados e a próxima execução continua dali
+            for future in futures:
+                future.cancel()
+            if pending:
+                db.save_photo_checks(pending)
+                checked += len(pending)
+    return checked
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verifica se as fotos dos cards ainda estão acessíveis.")
+    parser.add_argument("--workers", type=int, default=8, help="Requisições simultâneas.")
+    parser.add_argument("--rate", type=float, default=10.0, help="Máximo de requisições por segundo.")
+    parser.add_argument("--max-age-hours", type=float, default=24.0, help="Reverifica fotos verificadas há mais tempo que isso.")
+    parser.add_argument("--limit", type=int, default=None, help="Máximo de fotos nesta execução.")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Timeout de cada requisição, em segundos.")
+    args = parser.parse_args()
+
+    load_dotenv()
+    start = time.perf_counter()
+    checked = scan_photos(args.workers, args.rate, args.max_age_hours, args.limit, args.timeout)
+    broken = len(db.get_broken_photo_urls())
+    print(f"{checked} foto(s) verificada(s) em {time.perf_counter() - start:.1f}s; {broken} quebrada(s) no total.")
+
+
+if __name__ == "__main__":
+    main()
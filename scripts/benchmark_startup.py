@@ -0,0 +1,205 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Mede o custo de inicialização das páginas, cada medição num processo Python novo com o streamlit e o AppTest
+# já carregados (como no servidor, que já está de pé quando a página é acessada pela primeira vez):
+#   1. partida a frio: imports da página + primeira execução, incluindo o que a página importa sob demanda
+#      durante o render (ex.: o driver do banco na primeira conexão). Mostra também quantos módulos foram
+#      carregados nessa primeira execução e quais pacotes só uma das árvores carrega;
+#   2. reruns: mediana das execuções seguintes no mesmo processo (custo por interação).
+#
+# Com --compare <ref>, mede também a árvore de um ref do git (via git worktree), alternando as árvores a cada
+# rodada. Sem DATABASE_URL, cada árvore usa um banco SQLite temporário (árvores sem suporte a SQLite ficam sem
+# medição). Com DATABASE_URL de um PostgreSQL, as duas árvores usam esse banco, que precisa ter o esquema
+# completo (scripts/migration*.sql); se ele não tiver listas, uma lista de exemplo é criada.
+#
+# Uso: python scripts/benchmark_startup.py [--compare HEAD~5] [--runs 10] [--reruns 10]
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ENTRY_POINTS = ["app.py", "visualize.py", "pages/2_Detalhes_da_Lista.py", "pages/3_Busca_de_Cards.py"]
+
+
+def seed_database():
+    import db
+
+    conn = db.get_db_connection()
+    cur = conn.cursor()
+    cur.execute("INSERT INTO lists (name) VALUES (%s) RETURNING id", ("Benchmark",))
+    list_id = cur.fetchone()[0]
+    for i in range(1, 41):
+        cur.execute(
+            "INSERT INTO cards (name, photo_url, card_number, collection_total, language, list_id, card_order, condition, owned, card_type) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+            (f"Card {i}", "https://example.com/card.png", str(i), "100", "Inglês", list_id, i, "NM", True, "Normal")
+        )
+    conn.commit()
+    cur.close()
+    conn.close()
+    return list_id
+
+
+def prepare_database(root: Path) -> dict:
+    # Retorna o banco usado pela árvore e a lista aberta nas páginas de detalhe ({} = árvore sem medição)
+    sys.path.insert(0, str(root))
+    os.chdir(root)
+    if not os.getenv("DATABASE_URL"):
+        if not (root / "scripts" / "sqlite_schema.sql").exists():
+            return {}
+        os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/benchmark.db"
+        return {"database_url": os.environ["DATABASE_URL"], "list_id": seed_database()}
+
+    import db
+
+    lists = db.get_lists_with_counts()
+    return {"database_url": os.environ["DATABASE_URL"], "list_id": lists[0][0] if lists else seed_database()}
+
+
+def cold_start(root: Path, script: str, list_id: int, reruns: int) -> dict:
+    from streamlit.testing.v1 import AppTest
+
+    sys.path.insert(0, str(root))
+    os.chdir(root)
+    # Aquece o próprio AppTest para que o custo dele não entre na conta da página
+    AppTest.from_string("import streamlit as st\nst.write('')").run()
+
+    # Páginas de pages/ rodam a partir do app.py, como no deploy, para que st.page_link("app.py") resolva
+    at = AppTest.from_file(str(root / ("app.py" if script.startswith("pages/") else script)), default_timeout=60)
+    if script.startswith("pages/"):
+        at.switch_page(script)
+    at.session_state["current_list_id"] = list_id
+    at.session_state["current_list_name"] = "Benchmark"
+
+    modules_before = set(sys.modules)
+    start = time.perf_counter()
+    at.run()
+    first = (time.perf_counter() - start) * 1000
+    loaded = set(sys.modules) - modules_before
+
+    times = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        "first": first,
+        "rerun": statistics.median(times) if times else float("nan"),
+        "modules": len(loaded),
+        "packages": sorted({name.split(".")[0] for name in loaded}),
+        "errors": [str(e.message) for e in at.exception],
+    }
+
+
+def _run_json(*args: str, database_url: str | None = None) -> dict:
+    # Cada medição roda num processo próprio, para que módulos já importados não barateiem a seguinte
+    env = {**os.environ, "DATABASE_URL": database_url} if database_url else None
+    result = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), *args],
+        capture_output=True, text=True, check=True, env=env,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(roots: list[Path], runs: int, reruns: int) -> list[dict]:
+    # Alterna as árvores a cada rodada para que o ruído da máquina afete todas igualmente; fica o melhor tempo
+    if os.getenv("DATABASE_URL"):
+        # Banco compartilhado: preparado pela árvore atual, já que refs antigos não têm o módulo db
+        databases = [_run_json("--prepare", str(ROOT))] * len(roots)
+    else:
+        databases = [_run_json("--prepare", str(root)) for root in roots]
+    results = [{} for _ in roots]
+    for _ in range(runs):
+        for script in ENTRY_POINTS:
+            for root, database, best in zip(roots, databases, results):
+                if not database:
+                    continue
+                sample = _run_json(
+                    "--cold", str(root), script, "--list-id", str(database["list_id"]), "--reruns", str(reruns),
+                    database_url=database["database_url"],
+                )
+                if script in best:
+                    sample["first"] = min(sample["first"], best[script]["first"])
+                    sample["rerun"] = min(sample["rerun"], best[script]["rerun"])
+                best[script] = sample
+    return results
+
+
+def _ms(value) -> str:
+    return "      -" if value is None or value != value else f"{value:7.1f}"
+
+
+def print_report(current: dict, baseline: dict | None, ref: str | None):
+    trees = [current] + ([baseline] if baseline else [])
+    compared = [script for script in ENTRY_POINTS if baseline and script in current and script in baseline]
+    header = f"  {'':<32} {'atual':>15}" + (f" {ref:>15} {'diferença':>10}" if baseline else "")
+
+    print("Partida a frio: imports + primeira execução (melhor de --runs processos novos, ms / módulos carregados)")
+    print(header)
+    for script in ENTRY_POINTS:
+        line = f"  {script:<32}"
+        for results in trees:
+            sample = results.get(script)
+            line += f" {_ms(sample['first'])} / {sample['modules']:>5}" if sample else f" {'sem banco':>15}"
+        if script in compared:
+            line += f" {_ms(current[script]['first'] - baseline[script]['first']):>10}"
+        print(line)
+        if script in compared:
+            now, before = set(current[script]["packages"]), set(baseline[script]["packages"])
+            if before - now:
+                print(f"    só em {ref}: {', '.join(sorted(before - now))}")
+            if now - before:
+                print(f"    só na atual: {', '.join(sorted(now - before))}")
+
+    print("\nReruns: mediana das execuções seguintes no mesmo processo (melhor de --runs, ms)")
+    print(header)
+    for script in ENTRY_POINTS:
+        line = f"  {script:<32}"
+        for results in trees:
+            sample = results.get(script)
+            line += f" {_ms(sample['rerun']) if sample else 'sem banco':>15}"
+        if script in compared:
+            line += f" {_ms(current[script]['rerun'] - baseline[script]['rerun']):>10}"
+        print(line)
+        for results in trees:
+            for error in (results.get(script) or {}).get("errors", []):
+                print(f"    erro: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de partida a frio e reruns das páginas.")
+    parser.add_argument("--compare", metavar="REF", help="Ref do git para comparar (ex.: HEAD~5).")
+    parser.add_argument("--runs", type=int, default=10, help="Processos novos por página e árvore.")
+    parser.add_argument("--reruns", type=int, default=10, help="Reruns por página em cada processo.")
+    parser.add_argument("--prepare", help=argparse.SUPPRESS)
+    parser.add_argument("--cold", nargs=2, help=argparse.SUPPRESS)
+    parser.add_argument("--list-id", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.prepare:
+        print(json.dumps(prepare_database(Path(args.prepare))))
+        return
+    if args.cold:
+        print(json.dumps(cold_start(Path(args.cold[0]), args.cold[1], args.list_id, args.reruns)))
+        return
+
+    if not args.compare:
+        print_report(measure([ROOT], args.runs, args.reruns)[0], None, None)
+        return
+
+    worktree = Path(tempfile.mkdtemp()) / "baseline"
+    subprocess.run(["git", "worktree", "add", "--detach", str(worktree), args.compare], cwd=ROOT, check=True, capture_output=True)
+    try:
+        current, baseline = measure([ROOT, worktree], args.runs, args.reruns)
+    finally:
+        subprocess.run(["git", "worktree", "remove", "--force", str(worktree)], cwd=ROOT, capture_output=True)
+    print_report(current, baseline, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,7 @@ CREATE TABLE IF NOT EXISTS cards (
 -- Adiciona a coluna de ordenação se ela não existir (versão 2)
 DO $$
 BEGIN
-    IF NOT EXISTS(SELECT 1 FROM information_schema.columns WHERE table_name='cards' AND column_name='card_order') THEN
+    IF NOT EXISTS(SELECT 1 FROM information_schema.columns WHERE table_schema=current_schema() AND table_name='cards' AND column_name='card_order') THEN
         ALTER TABLE cards ADD COLUMN card_order INTEGER;
     END IF;
 END $$;
@@ -0,0 +1,3 @@
+-- Índice para carregar os cards de uma lista já na ordem de exibição
+-- Também evita a varredura da tabela cards ao deletar uma lista (ON DELETE CASCADE)
+CREATE INDEX IF NOT EXISTS idx_cards_list_id_card_order ON cards (list_id, card_order);
@@ -0,0 +1,42 @@
+-- Versão de alteração por lista, usada como ETag pela API HTTP somente-leitura (api.py)
+-- É incrementada sempre que a lista é renomeada ou algum card dela é inserido, alterado, movido ou removido
+ALTER TABLE lists ADD COLUMN IF NOT EXISTS version BIGINT NOT NULL DEFAULT 1;
+
+CREATE OR REPLACE FUNCTION bump_list_version_from_cards() RETURNS TRIGGER LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE lists SET version = version + 1 WHERE id IN (SELECT list_id FROM new_cards);
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE lists SET version = version + 1 WHERE id IN (SELECT list_id FROM old_cards);
+    ELSE
+        UPDATE lists SET version = version + 1 WHERE id IN (SELECT list_id FROM new_cards UNION SELECT list_id FROM old_cards);
+    END IF;
+    RETURN NULL;
+END $$;
+
+-- Triggers por comando (não por linha): um lote de cards incrementa cada lista uma única vez
+DROP TRIGGER IF EXISTS cards_insert_bump_list_version ON cards;
+CREATE TRIGGER cards_insert_bump_list_version AFTER INSERT ON cards
+    REFERENCING NEW TABLE AS new_cards
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_list_version_from_cards();
+
+DROP TRIGGER IF EXISTS cards_update_bump_list_version ON cards;
+CREATE TRIGGER cards_update_bump_list_version AFTER UPDATE ON cards
+    REFERENCING OLD TABLE AS old_cards NEW TABLE AS new_cards
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_list_version_from_cards();
+
+DROP TRIGGER IF EXISTS cards_delete_bump_list_version ON cards;
+CREATE TRIGGER cards_delete_bump_list_version AFTER DELETE ON cards
+    REFERENCING OLD TABLE AS old_cards
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_list_version_from_cards();
+
+CREATE OR REPLACE FUNCTION bump_list_version_on_rename() RETURNS TRIGGER LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.version := OLD.version + 1;
+    RETURN NEW;
+END $$;
+
+DROP TRIGGER IF EXISTS lists_rename_bump_version ON lists;
+CREATE TRIGGER lists_rename_bump_version BEFORE UPDATE OF name ON lists
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION bump_list_version_on_rename();
@@ -0,0 +1,13 @@
+-- Resultado da verificação periódica das fotos dos cards (photo_health.py)
+-- Uma linha por photo_url: cards copiados entre listas compartilham a mesma foto
+-- checked_at é gravado em UTC
+CREATE TABLE IF NOT EXISTS photo_checks (
+    photo_url VARCHAR(255) PRIMARY KEY,
+    status_code INTEGER,
+    content_length BIGINT,
+    error TEXT,
+    checked_at TIMESTAMP NOT NULL
+);
+
+-- Índice para a seleção incremental (fotos verificadas há mais tempo primeiro)
+CREATE INDEX IF NOT EXISTS idx_photo_checks_checked_at ON photo_checks (checked_at);
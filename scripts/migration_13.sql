@@ -0,0 +1,67 @@
+-- Reescreve a view de completude das coleções (scripts/migration_9.sql), mantendo as colunas
+-- A versão anterior materializava owned_cards (referenciada duas vezes) e testava cada número da sequência com
+-- ANY(numbers): consultar uma lista custava o mesmo que o acervo inteiro. Agora:
+--   * as CTEs são NOT MATERIALIZED e as janelas particionam por list_id, então WHERE list_id = X chega até a
+--     tabela cards (índice por lista) e o ramo do acervo inteiro (list_id NULL) é descartado;
+--   * os números faltantes saem dos intervalos entre números possuídos consecutivos (LAG), sem comparar cada
+--     número da sequência com todos os possuídos.
+DROP VIEW IF EXISTS set_completion;
+
+CREATE VIEW set_completion AS
+WITH owned_cards AS NOT MATERIALIZED (
+    SELECT list_id,
+           regexp_replace(btrim(collection_total), '^0+(?=.)', '') AS collection_total,
+           language,
+           regexp_replace(upper(btrim(card_number)), '^0+(?=.)', '') AS number_key
+    FROM cards
+    WHERE owned = TRUE AND btrim(coalesce(collection_total, '')) <> ''
+),
+-- Um registro por número possuído em cada escopo: cada lista e o acervo inteiro (list_id NULL)
+numbers AS NOT MATERIALIZED (
+    SELECT list_id, collection_total, language, number_key, COUNT(*) AS copies
+    FROM owned_cards
+    GROUP BY list_id, collection_total, language, number_key
+    UNION ALL
+    SELECT NULL, collection_total, language, number_key, COUNT(*)
+    FROM owned_cards
+    GROUP BY collection_total, language, number_key
+),
+-- number: o número como inteiro quando o total é numérico e o número está entre 1 e o total
+numbered AS NOT MATERIALIZED (
+    SELECT list_id, collection_total, language, copies, is_numeric,
+           CASE WHEN is_numeric AND number_key ~ '^[0-9]{1,4}$' THEN
+               CASE WHEN number_key::INT BETWEEN 1 AND collection_total::INT THEN number_key::INT END
+           END AS number
+    FROM (SELECT *, collection_total ~ '^[0-9]{1,4}$' AS is_numeric FROM numbers) AS n
+),
+gaps AS NOT MATERIALIZED (
+    SELECT *, coalesce(LAG(number) OVER (PARTITION BY list_id, collection_total, language ORDER BY number), 0) AS previous_number
+    FROM numbered
+),
+totals AS NOT MATERIALIZED (
+    SELECT list_id, collection_total, language, is_numeric,
+           (SUM(copies) OVER scope)::BIGINT AS owned_cards,
+           COUNT(*) OVER scope AS distinct_numbers,
+           COUNT(number) OVER scope AS numbers_in_range,
+           MAX(number) OVER scope AS last_number,
+           ARRAY_AGG(previous_number + 1) FILTER (WHERE number - previous_number > 1) OVER scope AS gap_starts,
+           ARRAY_AGG(number - 1) FILTER (WHERE number - previous_number > 1) OVER scope AS gap_ends,
+           ROW_NUMBER() OVER scope AS position
+    FROM gaps
+    WINDOW scope AS (PARTITION BY list_id, collection_total, language)
+)
+SELECT list_id,
+       collection_total,
+       language,
+       CASE WHEN is_numeric THEN collection_total::INT END AS total_numbers,
+       CASE WHEN is_numeric THEN numbers_in_range ELSE distinct_numbers END AS owned_numbers,
+       CASE WHEN is_numeric THEN ARRAY(
+           -- Intervalos entre números possuídos e o final da coleção (depois do maior número possuído)
+           SELECT n
+           FROM unnest(gap_starts || (coalesce(last_number, 0) + 1), gap_ends || collection_total::INT) AS g(first_missing, last_missing),
+                generate_series(g.first_missing, g.last_missing) AS n
+           ORDER BY n
+       ) ELSE '{}'::INT[] END AS missing_numbers,
+       owned_cards - distinct_numbers AS duplicate_count
+FROM totals
+WHERE position = 1;
@@ -0,0 +1,13 @@
+-- Adiciona a chave de identidade normalizada do card (nome, número, total, idioma e tipo)
+-- Usada para descobrir, com uma única busca no índice, se o card já existe em outra lista
+-- db.find_owned_copies aplica a mesma expressão aos dados do card novo
+ALTER TABLE cards ADD COLUMN IF NOT EXISTS identity_key TEXT GENERATED ALWAYS AS (
+    lower(btrim(regexp_replace(name, '\s+', ' ', 'g')))
+    || '|' || regexp_replace(lower(btrim(regexp_replace(card_number, '\s+', ' ', 'g'))), '^0+(?=.)', '')
+    || '|' || regexp_replace(lower(btrim(regexp_replace(coalesce(collection_total, ''), '\s+', ' ', 'g'))), '^0+(?=.)', '')
+    || '|' || lower(btrim(regexp_replace(language, '\s+', ' ', 'g')))
+    || '|' || lower(btrim(regexp_replace(card_type, '\s+', ' ', 'g')))
+) STORED;
+
+-- Índice para a verificação de duplicatas/posse ao adicionar um card
+CREATE INDEX IF NOT EXISTS idx_cards_identity_key ON cards (identity_key);
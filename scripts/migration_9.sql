@@ -0,0 +1,46 @@
+-- Chave de ordenação natural para números de card armazenados como texto
+-- Ex.: '5' < '12' < '123a' < 'SV001' < 'SV010' < 'TG05' (prefixo, parte numérica com zeros à esquerda e sufixo)
+CREATE OR REPLACE FUNCTION card_number_sort_key(card_number TEXT) RETURNS TEXT
+LANGUAGE SQL IMMUTABLE AS $$
+    SELECT upper(coalesce(substring(btrim(card_number) from '^[^0-9]*'), ''))
+        || lpad(coalesce(substring(btrim(card_number) from '[0-9]+'), ''), 10, '0')
+        || upper(coalesce(substring(btrim(card_number) from '^[^0-9]*[0-9]+(.*)$'), ''))
+$$;
+
+-- Completude das coleções por lista e no acervo inteiro (list_id NULL), agrupadas por total da coleção e idioma
+-- Considera apenas cards marcados como "Na coleção" e com total da coleção informado
+-- Números faltantes só são calculados quando o total é numérico (ex.: '198', mas não 'TG30')
+CREATE OR REPLACE VIEW set_completion AS
+WITH owned_cards AS (
+    SELECT list_id,
+           regexp_replace(btrim(collection_total), '^0+(?=.)', '') AS collection_total,
+           language,
+           regexp_replace(upper(btrim(card_number)), '^0+(?=.)', '') AS number_key
+    FROM cards
+    WHERE owned = TRUE AND btrim(coalesce(collection_total, '')) <> ''
+),
+scopes AS (
+    SELECT list_id, collection_total, language, number_key FROM owned_cards
+    UNION ALL
+    SELECT NULL, collection_total, language, number_key FROM owned_cards
+),
+grouped AS (
+    SELECT list_id, collection_total, language,
+           COUNT(*) AS owned_cards,
+           ARRAY_AGG(DISTINCT number_key) AS numbers
+    FROM scopes
+    GROUP BY list_id, collection_total, language
+)
+SELECT g.list_id,
+       g.collection_total,
+       g.language,
+       CASE WHEN g.collection_total ~ '^[0-9]{1,4}$' THEN g.collection_total::INT END AS total_numbers,
+       CASE WHEN g.collection_total ~ '^[0-9]{1,4}$' THEN s.owned_numbers ELSE cardinality(g.numbers) END AS owned_numbers,
+       coalesce(s.missing_numbers, '{}') AS missing_numbers,
+       g.owned_cards - cardinality(g.numbers) AS duplicate_count
+FROM grouped g
+CROSS JOIN LATERAL (
+    SELECT COUNT(*) FILTER (WHERE n::TEXT = ANY(g.numbers)) AS owned_numbers,
+           ARRAY_AGG(n ORDER BY n) FILTER (WHERE NOT n::TEXT = ANY(g.numbers)) AS missing_numbers
+    FROM generate_series(1, CASE WHEN g.collection_total ~ '^[0-9]{1,4}$' THEN g.collection_total::INT ELSE 0 END) AS n
+) s;
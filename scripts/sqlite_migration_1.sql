@@ -0,0 +1,60 @@
+-- Passo 1 do esquema SQLite (PRAGMA user_version 0 -> 1), aplicado por db.py a arquivos criados antes do versionamento
+-- Nesses arquivos a chave de identidade dependia de funções Python (card_identity_key) e não reduzia espaços internos.
+-- Colunas geradas não podem ser alteradas, então a tabela cards é recriada com a definição atual, preservando os ids
+-- (e com eles o índice FTS). Em seguida db.py aplica scripts/sqlite_schema.sql, que recria a view set_completion,
+-- os índices e os triggers removidos aqui e cria as tabelas que faltarem (ex.: photo_checks).
+-- A coluna lists.version, ausente nos arquivos anteriores à API HTTP, é adicionada por db.py antes deste passo.
+
+DROP VIEW IF EXISTS set_completion;
+
+CREATE TABLE cards_new (
+    id INTEGER PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    photo_url VARCHAR(255) NOT NULL,
+    card_number VARCHAR(20) NOT NULL,
+    collection_total VARCHAR(20),
+    language VARCHAR(50) NOT NULL,
+    list_id INTEGER NOT NULL REFERENCES lists(id) ON DELETE CASCADE,
+    card_order INTEGER,
+    grading_note INTEGER,
+    condition VARCHAR(3) NOT NULL CHECK (condition IN ('GM', 'M', 'NM', 'SP', 'MP', 'HP', 'D')),
+    owned BOOLEAN NOT NULL DEFAULT TRUE,
+    card_type VARCHAR(20) NOT NULL CHECK (
+        card_type IN (
+            'Normal', 'Foil', 'Reverse Foil', 'Assinada', 'Promo', 'Textless', 'Alterada', 'Pre Release', 'Edition One', 'Shadowless', 'Staff', 'Misprint', 'Shattered Holo', 'Master Ball', 'Poke Ball'
+        )
+    ),
+    -- Chave de identidade equivalente à de scripts/migration_8.sql (db.find_owned_copies usa as mesmas expressões).
+    -- Em duas colunas porque o parser do SQLite limita o aninhamento de funções:
+    -- identity_base remove espaços nas pontas e zeros à esquerda do número e do total ('005' = '5')
+    -- e reduz espaços internos repetidos (até 32 seguidos) a um só
+    identity_base TEXT GENERATED ALWAYS AS (
+        replace(replace(replace(replace(replace(
+            replace(replace(replace(replace(replace(
+                trim(name, char(32, 9, 10, 11, 12, 13))
+                || '|' || coalesce(nullif(ltrim(trim(card_number, char(32, 9, 10, 11, 12, 13)), '0'), ''), substr(trim(card_number, char(32, 9, 10, 11, 12, 13)), -1))
+                || '|' || coalesce(nullif(ltrim(trim(coalesce(collection_total, ''), char(32, 9, 10, 11, 12, 13)), '0'), ''), substr(trim(coalesce(collection_total, ''), char(32, 9, 10, 11, 12, 13)), -1))
+                || '|' || trim(language, char(32, 9, 10, 11, 12, 13))
+                || '|' || trim(card_type, char(32, 9, 10, 11, 12, 13))
+            , char(9), ' '), char(10), ' '), char(11), ' '), char(12), ' '), char(13), ' ')
+        , '  ', ' '), '  ', ' '), '  ', ' '), '  ', ' '), '  ', ' ')
+    ) VIRTUAL,
+    -- identity_key converte para minúsculas, inclusive as letras acentuadas (o lower() nativo só converte ASCII)
+    identity_key TEXT GENERATED ALWAYS AS (
+        lower(
+            replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(
+            replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(
+                identity_base
+            , 'À', 'à'), 'Á', 'á'), 'Â', 'â'), 'Ã', 'ã'), 'Ä', 'ä'), 'Å', 'å'), 'Ç', 'ç'), 'È', 'è'), 'É', 'é'), 'Ê', 'ê'), 'Ë', 'ë'), 'Ì', 'ì'), 'Í', 'í')
+            , 'Î', 'î'), 'Ï', 'ï'), 'Ñ', 'ñ'), 'Ò', 'ò'), 'Ó', 'ó'), 'Ô', 'ô'), 'Õ', 'õ'), 'Ö', 'ö'), 'Ù', 'ù'), 'Ú', 'ú'), 'Û', 'û'), 'Ü', 'ü')
+        )
+    ) STORED
+);
+
+INSERT INTO cards_new (id, name, photo_url, card_number, collection_total, language, list_id, card_order, grading_note, condition, owned, card_type)
+SELECT id, name, photo_url, card_number, collection_total, language, list_id, card_order, grading_note, condition, owned, card_type
+FROM cards;
+
+DROP TABLE cards;
+
+ALTER TABLE cards_new RENAME TO cards;
@@ -0,0 +1,4 @@
+-- Passo 2 do esquema SQLite (PRAGMA user_version 1 -> 2), equivalente a scripts/migration_13.sql
+-- A view set_completion passa a calcular os números faltantes por intervalos e a aceitar o filtro por lista
+-- no índice de cards; db.py a recria com scripts/sqlite_schema.sql logo depois deste passo
+DROP VIEW IF EXISTS set_completion;
@@ -0,0 +1,162 @@
+-- Esquema do backend SQLite embutido (DATABASE_URL=sqlite:///pokelist.db)
+-- Equivalente ao resultado de scripts/migration.sql até scripts/migration_13.sql no PostgreSQL
+-- Aplicado automaticamente por db.py na primeira conexão de cada processo; arquivos existentes são atualizados antes
+-- pelos passos scripts/sqlite_migration_<n>.sql (ao mudar uma tabela, crie o próximo passo e incremente db.SQLITE_SCHEMA_VERSION)
+-- Usa apenas funções nativas do SQLite: o arquivo pode ser lido e alterado pelo sqlite3 CLI e outras ferramentas
+
+CREATE TABLE IF NOT EXISTS lists (
+    id INTEGER PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS cards (
+    id INTEGER PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    photo_url VARCHAR(255) NOT NULL,
+    card_number VARCHAR(20) NOT NULL,
+    collection_total VARCHAR(20),
+    language VARCHAR(50) NOT NULL,
+    list_id INTEGER NOT NULL REFERENCES lists(id) ON DELETE CASCADE,
+    card_order INTEGER,
+    grading_note INTEGER,
+    condition VARCHAR(3) NOT NULL CHECK (condition IN ('GM', 'M', 'NM', 'SP', 'MP', 'HP', 'D')),
+    owned BOOLEAN NOT NULL DEFAULT TRUE,
+    card_type VARCHAR(20) NOT NULL CHECK (
+        card_type IN (
+            'Normal', 'Foil', 'Reverse Foil', 'Assinada', 'Promo', 'Textless', 'Alterada', 'Pre Release', 'Edition One', 'Shadowless', 'Staff', 'Misprint', 'Shattered Holo', 'Master Ball', 'Poke Ball'
+        )
+    ),
+    -- Chave de identidade equivalente à de scripts/migration_8.sql (db.find_owned_copies usa as mesmas expressões).
+    -- Em duas colunas porque o parser do SQLite limita o aninhamento de funções:
+    -- identity_base remove espaços nas pontas e zeros à esquerda do número e do total ('005' = '5')
+    -- e reduz espaços internos repetidos (até 32 seguidos) a um só
+    identity_base TEXT GENERATED ALWAYS AS (
+        replace(replace(replace(replace(replace(
+            replace(replace(replace(replace(replace(
+                trim(name, char(32, 9, 10, 11, 12, 13))
+                || '|' || coalesce(nullif(ltrim(trim(card_number, char(32, 9, 10, 11, 12, 13)), '0'), ''), substr(trim(card_number, char(32, 9, 10, 11, 12, 13)), -1))
+                || '|' || coalesce(nullif(ltrim(trim(coalesce(collection_total, ''), char(32, 9, 10, 11, 12, 13)), '0'), ''), substr(trim(coalesce(collection_total, ''), char(32, 9, 10, 11, 12, 13)), -1))
+                || '|' || trim(language, char(32, 9, 10, 11, 12, 13))
+                || '|' || trim(card_type, char(32, 9, 10, 11, 12, 13))
+            , char(9), ' '), char(10), ' '), char(11), ' '), char(12), ' '), char(13), ' ')
+        , '  ', ' '), '  ', ' '), '  ', ' '), '  ', ' '), '  ', ' ')
+    ) VIRTUAL,
+    -- identity_key converte para minúsculas, inclusive as letras acentuadas (o lower() nativo só converte ASCII)
+    identity_key TEXT GENERATED ALWAYS AS (
+        lower(
+            replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(
+            replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(
+                identity_base
+            , 'À', 'à'), 'Á', 'á'), 'Â', 'â'), 'Ã', 'ã'), 'Ä', 'ä'), 'Å', 'å'), 'Ç', 'ç'), 'È', 'è'), 'É', 'é'), 'Ê', 'ê'), 'Ë', 'ë'), 'Ì', 'ì'), 'Í', 'í')
+            , 'Î', 'î'), 'Ï', 'ï'), 'Ñ', 'ñ'), 'Ò', 'ò'), 'Ó', 'ó'), 'Ô', 'ô'), 'Õ', 'õ'), 'Ö', 'ö'), 'Ù', 'ù'), 'Ú', 'ú'), 'Û', 'û'), 'Ü', 'ü')
+        )
+    ) STORED
+);
+
+CREATE INDEX IF NOT EXISTS idx_cards_identity_key ON cards (identity_key);
+CREATE INDEX IF NOT EXISTS idx_cards_list_id_card_order ON cards (list_id, card_order);
+
+-- Verificação das fotos dos cards (photo_health.py), equivalente a scripts/migration_12.sql
+CREATE TABLE IF NOT EXISTS photo_checks (
+    photo_url VARCHAR(255) PRIMARY KEY,
+    status_code INTEGER,
+    content_length INTEGER,
+    error TEXT,
+    checked_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_photo_checks_checked_at ON photo_checks (checked_at);
+
+-- Busca por trecho do nome (equivalente ao ILIKE '%termo%' do PostgreSQL)
+CREATE VIRTUAL TABLE IF NOT EXISTS cards_fts USING fts5(name, content='cards', content_rowid='id', tokenize='trigram');
+
+CREATE TRIGGER IF NOT EXISTS cards_fts_insert AFTER INSERT ON cards BEGIN
+    INSERT INTO cards_fts (rowid, name) VALUES (new.id, new.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS cards_fts_delete AFTER DELETE ON cards BEGIN
+    INSERT INTO cards_fts (cards_fts, rowid, name) VALUES ('delete', old.id, old.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS cards_fts_update AFTER UPDATE OF name ON cards BEGIN
+    INSERT INTO cards_fts (cards_fts, rowid, name) VALUES ('delete', old.id, old.name);
+    INSERT INTO cards_fts (rowid, name) VALUES (new.id, new.name);
+END;
+
+-- Versão de alteração por lista (ETag da API HTTP), equivalente aos triggers de scripts/migration_11.sql
+CREATE TRIGGER IF NOT EXISTS cards_insert_bump_list_version AFTER INSERT ON cards BEGIN
+    UPDATE lists SET version = version + 1 WHERE id = new.list_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS cards_update_bump_list_version AFTER UPDATE ON cards BEGIN
+    UPDATE lists SET version = version + 1 WHERE id IN (old.list_id, new.list_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS cards_delete_bump_list_version AFTER DELETE ON cards BEGIN
+    UPDATE lists SET version = version + 1 WHERE id = old.list_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS lists_rename_bump_version AFTER UPDATE OF name ON lists WHEN old.name IS NOT new.name BEGIN
+    UPDATE lists SET version = version + 1 WHERE id = new.id;
+END;
+
+-- Completude das coleções (mesmas colunas e estratégia da view do PostgreSQL em scripts/migration_13.sql)
+-- missing_numbers vem como texto com intervalos separados por vírgula ('2-4,7-7'); db.get_set_completion converte para lista
+CREATE VIEW IF NOT EXISTS set_completion AS
+WITH owned_cards AS NOT MATERIALIZED (
+    SELECT list_id,
+           CASE WHEN ltrim(trim(collection_total), '0') = '' THEN '0' ELSE ltrim(trim(collection_total), '0') END AS collection_total,
+           language,
+           CASE WHEN ltrim(upper(trim(card_number)), '0') = '' AND trim(card_number) <> '' THEN '0' ELSE ltrim(upper(trim(card_number)), '0') END AS number_key
+    FROM cards
+    WHERE owned = TRUE AND trim(coalesce(collection_total, '')) <> ''
+),
+-- Um registro por número possuído em cada escopo: cada lista e o acervo inteiro (list_id NULL)
+numbers AS NOT MATERIALIZED (
+    SELECT list_id, collection_total, language, number_key, COUNT(*) AS copies FROM owned_cards
+    GROUP BY list_id, collection_total, language, number_key
+    UNION ALL
+    SELECT NULL, collection_total, language, number_key, COUNT(*) FROM owned_cards
+    GROUP BY collection_total, language, number_key
+),
+-- number: o número como inteiro quando o total é numérico e o número está entre 1 e o total
+numbered AS NOT MATERIALIZED (
+    SELECT list_id, collection_total, language, copies, is_numeric,
+           CASE WHEN is_numeric AND number_key NOT GLOB '*[^0-9]*' AND length(number_key) BETWEEN 1 AND 4
+                     AND CAST(number_key AS INTEGER) BETWEEN 1 AND CAST(collection_total AS INTEGER)
+                THEN CAST(number_key AS INTEGER) END AS number
+    FROM (
+        SELECT *, collection_total NOT GLOB '*[^0-9]*' AND length(collection_total) <= 4 AS is_numeric
+        FROM numbers
+    )
+),
+-- Números faltantes como intervalos entre números possuídos consecutivos (sem gerar a sequência inteira)
+gaps AS NOT MATERIALIZED (
+    SELECT *, coalesce(LAG(number) OVER (PARTITION BY list_id, collection_total, language ORDER BY number), 0) AS previous_number
+    FROM numbered
+),
+totals AS NOT MATERIALIZED (
+    SELECT list_id, collection_total, language, is_numeric,
+           SUM(copies) OVER scope AS owned_cards,
+           COUNT(*) OVER scope AS distinct_numbers,
+           COUNT(number) OVER scope AS numbers_in_range,
+           MAX(number) OVER scope AS last_number,
+           group_concat(CASE WHEN number - previous_number > 1 THEN (previous_number + 1) || '-' || (number - 1) END) OVER scope AS missing_ranges,
+           ROW_NUMBER() OVER scope AS position
+    FROM gaps
+    WINDOW scope AS (PARTITION BY list_id, collection_total, language)
+)
+SELECT list_id,
+       collection_total,
+       language,
+       CASE WHEN is_numeric THEN CAST(collection_total AS INTEGER) END AS total_numbers,
+       CASE WHEN is_numeric THEN numbers_in_range ELSE distinct_numbers END AS owned_numbers,
+       CASE WHEN NOT is_numeric THEN ''
+            WHEN coalesce(last_number, 0) < CAST(collection_total AS INTEGER)
+                THEN coalesce(missing_ranges || ',', '') || (coalesce(last_number, 0) + 1) || '-' || collection_total
+            ELSE coalesce(missing_ranges, '')
+       END AS missing_numbers,
+       owned_cards - distinct_numbers AS duplicate_count
+FROM totals
+WHERE position = 1;
@@ -0,0 +1,80 @@
+import os
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import db  # noqa: E402
+
+# Os testes sempre rodam no SQLite. Com DATABASE_URL=postgresql://... no ambiente, os mesmos casos
+# rodam também no PostgreSQL, num schema temporário criado a partir de scripts/migration*.sql.
+POSTGRES_URL = os.getenv("DATABASE_URL") if (os.getenv("DATABASE_URL") or "").startswith("postgres") else None
+
+MIGRATIONS = ["migration.sql"] + [f"migration_{n}.sql" for n in range(2, 14)]
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'pokelist.db'}")
+    return tmp_path / "pokelist.db"
+
+
+@pytest.fixture
+def postgres_db(monkeypatch):
+    if not POSTGRES_URL:
+        pytest.skip("DATABASE_URL do PostgreSQL não informada")
+    psycopg2 = pytest.importorskip("psycopg2")
+
+    schema = f"pokelist_test_{uuid.uuid4().hex[:8]}"
+    conn = psycopg2.connect(POSTGRES_URL)
+    conn.autocommit = True
+    cur = conn.cursor()
+    cur.execute(f"CREATE SCHEMA {schema}")
+    cur.execute(f"SET search_path TO {schema}")
+    for name in MIGRATIONS:
+        cur.execute((ROOT / "scripts" / name).read_text(encoding="utf-8"))
+
+    separator = "&" if "?" in POSTGRES_URL else "?"
+    monkeypatch.setenv("DATABASE_URL", f"{POSTGRES_URL}{separator}options=-csearch_path%3D{schema}")
+    try:
+        yield schema
+    finally:
+        cur.execute(f"DROP SCHEMA {schema} CASCADE")
+        cur.close()
+        conn.close()
+
+
+@pytest.fixture(params=["sqlite", "postgres"])
+def backend(request):
+    request.getfixturevalue(f"{request.param}_db")
+    return request.param
+
+
+def insert_list(name):
+    conn = db.get_db_connection()
+    cur = conn.cursor()
+    cur.execute("INSERT INTO lists (name) VALUES (%s) RETURNING id", (name,))
+    list_id = cur.fetchone()[0]
+    conn.commit()
+    cur.close()
+    conn.close()
+    return list_id
+
+
+def insert_card(list_id, name, card_number, collection_total=None, language="Inglês", owned=True,
+                photo_url="https://example.com/card.png", card_type="Normal", condition="NM", grading_note=None):
+    conn = db.get_db_connection()
+    cur = conn.cursor()
+    cur.execute(
+        "INSERT INTO cards (name, photo_url, card_number, collection_total, language, list_id, card_order, condition, grading_note, owned, card_type) VALUES (%s, %s, %s, %s, %s, %s, (SELECT COALESCE(MAX(card_order), 0) + 1 FROM cards WHERE list_id = %s), %s, %s, %s, %s) RETURNING id",
+        (name, photo_url, card_number, collection_total, language, list_id, list_id, condition, grading_note, owned, card_type)
+    )
+    card_id = cur.fetchone()[0]
+    conn.commit()
+    cur.close()
+    conn.close()
+    return card_id
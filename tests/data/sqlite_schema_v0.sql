@@ -0,0 +1,109 @@
+-- Esquema SQLite criado pelas versões anteriores ao PRAGMA user_version (commit 3d15c72), usado em tests/test_db.py
+-- para conferir a atualização de arquivos antigos. Depende das funções Python card_identity_key e strip_leading_zeros.
+
+-- Esquema do backend SQLite embutido (DATABASE_URL=sqlite:///pokelist.db)
+-- Equivalente ao resultado de scripts/migration.sql até scripts/migration_10.sql no PostgreSQL
+-- Aplicado automaticamente por db.py na primeira conexão de cada processo
+-- As funções card_identity_key, card_number_sort_key e strip_leading_zeros são registradas por db.py
+
+CREATE TABLE IF NOT EXISTS lists (
+    id INTEGER PRIMARY KEY,
+    name VARCHAR(100) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS cards (
+    id INTEGER PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    photo_url VARCHAR(255) NOT NULL,
+    card_number VARCHAR(20) NOT NULL,
+    collection_total VARCHAR(20),
+    language VARCHAR(50) NOT NULL,
+    list_id INTEGER NOT NULL REFERENCES lists(id) ON DELETE CASCADE,
+    card_order INTEGER,
+    grading_note INTEGER,
+    condition VARCHAR(3) NOT NULL CHECK (condition IN ('GM', 'M', 'NM', 'SP', 'MP', 'HP', 'D')),
+    owned BOOLEAN NOT NULL DEFAULT TRUE,
+    card_type VARCHAR(20) NOT NULL CHECK (
+        card_type IN (
+            'Normal', 'Foil', 'Reverse Foil', 'Assinada', 'Promo', 'Textless', 'Alterada', 'Pre Release', 'Edition One', 'Shadowless', 'Staff', 'Misprint', 'Shattered Holo', 'Master Ball', 'Poke Ball'
+        )
+    ),
+    identity_key TEXT GENERATED ALWAYS AS (card_identity_key(name, card_number, collection_total, language, card_type)) STORED
+);
+
+CREATE INDEX IF NOT EXISTS idx_cards_identity_key ON cards (identity_key);
+CREATE INDEX IF NOT EXISTS idx_cards_list_id_card_order ON cards (list_id, card_order);
+
+-- Busca por trecho do nome (equivalente ao ILIKE '%termo%' do PostgreSQL)
+CREATE VIRTUAL TABLE IF NOT EXISTS cards_fts USING fts5(name, content='cards', content_rowid='id', tokenize='trigram');
+
+CREATE TRIGGER IF NOT EXISTS cards_fts_insert AFTER INSERT ON cards BEGIN
+    INSERT INTO cards_fts (rowid, name) VALUES (new.id, new.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS cards_fts_delete AFTER DELETE ON cards BEGIN
+    INSERT INTO cards_fts (cards_fts, rowid, name) VALUES ('delete', old.id, old.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS cards_fts_update AFTER UPDATE OF name ON cards BEGIN
+    INSERT INTO cards_fts (cards_fts, rowid, name) VALUES ('delete', old.id, old.name);
+    INSERT INTO cards_fts (rowid, name) VALUES (new.id, new.name);
+END;
+
+-- Completude das coleções (mesmas colunas da view do PostgreSQL em scripts/migration_9.sql)
+-- missing_numbers vem como texto separado por vírgula; db.get_set_completion converte para lista
+CREATE VIEW IF NOT EXISTS set_completion AS
+WITH RECURSIVE owned_cards AS (
+    SELECT list_id,
+           strip_leading_zeros(trim(collection_total)) AS collection_total,
+           language,
+           strip_leading_zeros(upper(trim(card_number))) AS number_key
+    FROM cards
+    WHERE owned = TRUE AND trim(coalesce(collection_total, '')) <> ''
+),
+scopes AS (
+    SELECT list_id, collection_total, language, number_key FROM owned_cards
+    UNION ALL
+    SELECT NULL, collection_total, language, number_key FROM owned_cards
+),
+grouped AS (
+    SELECT list_id, collection_total, language,
+           COUNT(*) AS owned_cards,
+           COUNT(DISTINCT number_key) AS distinct_numbers,
+           collection_total NOT GLOB '*[^0-9]*' AND length(collection_total) <= 4 AS is_numeric
+    FROM scopes
+    GROUP BY list_id, collection_total, language
+),
+series (n) AS (
+    SELECT 1
+    UNION ALL
+    SELECT n + 1 FROM series
+    WHERE n < (SELECT MAX(CAST(collection_total AS INTEGER)) FROM grouped WHERE is_numeric)
+),
+missing AS (
+    SELECT g.list_id, g.collection_total, g.language,
+           group_concat(s.n) AS missing_numbers,
+           COUNT(*) AS missing_count
+    FROM grouped g
+    JOIN series s ON s.n <= CAST(g.collection_total AS INTEGER)
+    WHERE g.is_numeric AND NOT EXISTS (
+        SELECT 1 FROM scopes o
+        WHERE o.list_id IS g.list_id
+          AND o.collection_total = g.collection_total
+          AND o.language = g.language
+          AND o.number_key = CAST(s.n AS TEXT)
+    )
+    GROUP BY g.list_id, g.collection_total, g.language
+)
+SELECT g.list_id,
+       g.collection_total,
+       g.language,
+       CASE WHEN g.is_numeric THEN CAST(g.collection_total AS INTEGER) END AS total_numbers,
+       CASE WHEN g.is_numeric THEN CAST(g.collection_total AS INTEGER) - coalesce(m.missing_count, 0) ELSE g.distinct_numbers END AS owned_numbers,
+       coalesce(m.missing_numbers, '') AS missing_numbers,
+       g.owned_cards - g.distinct_numbers AS duplicate_count
+FROM grouped g
+LEFT JOIN missing m
+    ON m.list_id IS g.list_id
+   AND m.collection_total = g.collection_total
+   AND m.language = g.language;
@@ -0,0 +1,146 @@
+import gzip
+import http.client
+import json
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from api import ApiHandler
+from conftest import insert_card, insert_list
+
+
+@pytest.fixture
+def api(sqlite_db):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ApiHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+
+    def request(path, method="GET", **headers):
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+        conn.request(method, path, headers=headers)
+        response = conn.getresponse()
+        body = response.read()
+        conn.close()
+        return response, body
+
+    yield request
+    server.shutdown()
+    server.server_close()
+
+
+def json_body(response, body):
+    if response.getheader("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return json.loads(body)
+
+
+def test_lists_and_cards(api):
+    binder = insert_list("Binder")
+    insert_list("Avulsos")
+    for name in ("Bulbasaur", "Ivysaur", "Venusaur"):
+        insert_card(binder, name, "1")
+
+    response, body = api("/lists")
+    assert response.status == 200
+    assert json_body(response, body)["items"] == [
+        {"id": 2, "name": "Avulsos", "total_cards": 0},
+        {"id": binder, "name": "Binder", "total_cards": 3},
+    ]
+
+    response, body = api(f"/lists/{binder}/cards?fields=name,card_order")
+    assert json_body(response, body)["items"] == [
+        {"name": "Bulbasaur", "card_order": 1},
+        {"name": "Ivysaur", "card_order": 2},
+        {"name": "Venusaur", "card_order": 3},
+    ]
+
+
+def test_pagination_next_offset(api):
+    binder = insert_list("Binder")
+    for name in ("Bulbasaur", "Ivysaur", "Venusaur"):
+        insert_card(binder, name, "1")
+
+    page = json_body(*api(f"/lists/{binder}/cards?limit=2&fields=name"))
+    assert (page["items"], page["next_offset"]) == ([{"name": "Bulbasaur"}, {"name": "Ivysaur"}], 2)
+    page = json_body(*api(f"/lists/{binder}/cards?limit=2&offset=2&fields=name"))
+    assert (page["items"], page["next_offset"]) == ([{"name": "Venusaur"}], None)
+
+    page = json_body(*api("/cards/search?name=saur&limit=1&offset=1&fields=name,list_name"))
+    assert (page["items"], page["next_offset"]) == ([{"name": "Ivysaur", "list_name": "Binder"}], 2)
+
+
+def test_etag_not_modified_until_a_card_changes(api):
+    binder = insert_list("Binder")
+    other = insert_list("Outra")
+    insert_card(binder, "Pikachu", "25")
+
+    response, _ = api(f"/lists/{binder}/cards")
+    etag = response.getheader("ETag")
+    assert etag.startswith('W/"')
+
+    response, body = api(f"/lists/{binder}/cards", **{"If-None-Match": etag})
+    assert (response.status, body) == (304, b"")
+    assert response.getheader("ETag") == etag
+
+    # Card em outra lista não muda a versão desta
+    insert_card(other, "Mew", "151")
+    assert api(f"/lists/{binder}/cards", **{"If-None-Match": etag})[0].status == 304
+    search_etag = api("/cards/search?name=pika")[0].getheader("ETag")
+
+    insert_card(binder, "Raichu", "26")
+    response, body = api(f"/lists/{binder}/cards", **{"If-None-Match": etag})
+    assert response.status == 200
+    assert response.getheader("ETag") != etag
+    assert [card["name"] for card in json_body(response, body)["items"]] == ["Pikachu", "Raichu"]
+    # A busca cruza todas as listas: qualquer alteração invalida o ETag
+    assert api("/cards/search?name=pika", **{"If-None-Match": search_etag})[0].status == 200
+
+
+def test_gzip_only_when_accepted(api):
+    binder = insert_list("Binder")
+    for number in range(1, 31):
+        insert_card(binder, f"Card {number}", str(number))
+
+    response, body = api(f"/lists/{binder}/cards", **{"Accept-Encoding": "gzip"})
+    assert response.getheader("Content-Encoding") == "gzip"
+    assert int(response.getheader("Content-Length")) == len(body)
+    assert len(json_body(response, body)["items"]) == 30
+
+    response, body = api(f"/lists/{binder}/cards")
+    assert response.getheader("Content-Encoding") is None
+    assert len(json.loads(body)["items"]) == 30
+
+
+def test_head_has_get_headers_without_body(api):
+    binder = insert_list("Binder")
+    insert_card(binder, "Pikachu", "25")
+
+    get_response, get_body = api(f"/lists/{binder}/cards")
+    response, body = api(f"/lists/{binder}/cards", method="HEAD")
+    assert (response.status, body) == (200, b"")
+    assert response.getheader("ETag") == get_response.getheader("ETag")
+    assert int(response.getheader("Content-Length")) == len(get_body)
+
+    response, _ = api(f"/lists/{binder}/cards", method="HEAD", **{"If-None-Match": get_response.getheader("ETag")})
+    assert response.status == 304
+    assert api("/lists/999/cards", method="HEAD")[0].status == 404
+
+
+@pytest.mark.parametrize("path, status", [
+    ("/lists?limit=0", 400),
+    ("/lists?limit=501", 400),
+    ("/lists?offset=abc", 400),
+    ("/lists?fields=id,price", 400),
+    ("/cards/search?status=sold", 400),
+    ("/cards/search?sort=price", 400),
+    ("/cards/search?min_note=11", 400),
+    ("/lists/999/cards", 404),
+    ("/lists/abc/cards", 404),
+    ("/precos", 404),
+])
+def test_errors(api, path, status):
+    insert_list("Binder")
+    response, body = api(path)
+    assert response.status == status
+    assert "error" in json.loads(body)
@@ -0,0 +1,219 @@
+import sqlite3
+from pathlib import Path
+
+import db
+from conftest import insert_card, insert_list
+
+# Mesmos casos em todos os backends (fixture backend: SQLite sempre, PostgreSQL quando configurado)
+
+
+def test_get_lists_with_counts(backend):
+    binder = insert_list("Binder")
+    insert_list("Avulsos")
+    insert_card(binder, "Pikachu", "25")
+    insert_card(binder, "Raichu", "26")
+
+    assert [(name, total) for _, name, total in db.get_lists_with_counts()] == [("Avulsos", 0), ("Binder", 2)]
+    assert [name for _, name, _ in db.get_lists_with_counts(limit=1, offset=1)] == ["Binder"]
+
+
+def test_get_cards_for_list_in_card_order(backend):
+    binder = insert_list("Binder")
+    other = insert_list("Outra")
+    for name in ("Bulbasaur", "Ivysaur", "Venusaur"):
+        insert_card(binder, name, "1")
+    insert_card(other, "Mew", "151")
+
+    cards = db.get_cards_for_list(binder)
+    assert [card[1] for card in cards] == ["Bulbasaur", "Ivysaur", "Venusaur"]
+    assert [card[6] for card in cards] == [1, 2, 3]
+    assert cards[0][9] is True
+    assert [card[1] for card in db.get_cards_for_list(binder, limit=2, offset=1)] == ["Ivysaur", "Venusaur"]
+
+
+def test_search_cards_by_name_substring(backend):
+    binder = insert_list("Binder")
+    insert_card(binder, "Pikachu", "25")
+    insert_card(binder, "Raichu", "26")
+    insert_card(binder, "Mew", "151")
+
+    # Termo com 3+ caracteres (FTS5 trigram no SQLite), sem diferenciar maiúsculas
+    assert sorted(row[0] for row in db.search_cards("CHU")) == ["Pikachu", "Raichu"]
+    # Termo curto (LIKE no SQLite)
+    assert [row[0] for row in db.search_cards("ew")] == ["Mew"]
+    assert db.search_cards("Charizard") == []
+
+
+def test_search_cards_filters(backend):
+    binder = insert_list("Binder")
+    insert_card(binder, "Pikachu", "25", owned=True, grading_note=9)
+    insert_card(binder, "Pikachu", "25", owned=False, language="Japonês", condition="MP")
+
+    assert [row[9] for row in db.search_cards("pika", status="owned")] == [True]
+    assert [row[4] for row in db.search_cards("pika", status="wish")] == ["Japonês"]
+    assert [row[8] for row in db.search_cards(None, condition="MP")] == ["MP"]
+    assert [row[7] for row in db.search_cards(None, min_note=8)] == [9]
+    assert [row[5] for row in db.search_cards("pika", language="Inglês")] == ["Binder"]
+
+
+def test_pagination_with_repeated_names_is_stable(backend):
+    binders = [insert_list("Binder") for _ in range(3)]
+    card_ids = [insert_card(binders[0], "Pikachu", "25") for _ in range(7)]
+
+    def all_pages(fetch, page_size=2):
+        rows, offset = [], 0
+        while page := fetch(limit=page_size, offset=offset):
+            rows += page
+            offset += page_size
+        return rows
+
+    assert [row[0] for row in all_pages(db.get_lists_with_counts)] == binders
+    for sort in ("name", "number", "grade_desc"):
+        rows = all_pages(lambda **page: db.search_cards("Pikachu", sort=sort, **page))
+        assert [row[6] for row in rows] == card_ids
+
+
+def test_search_cards_natural_number_order(backend):
+    binder = insert_list("Binder")
+    for number in ("TG05", "123a", "SV010", "12", "SV001", "5"):
+        insert_card(binder, f"Card {number}", number)
+
+    rows = db.search_cards(None, sort="number")
+    assert [row[2] for row in rows] == ["5", "12", "123a", "SV001", "SV010", "TG05"]
+
+
+def test_card_number_sort_key():
+    numbers = ["TG05", "123a", "SV010", "12", "SV001", "5", None]
+    assert sorted(numbers, key=db.card_number_sort_key) == [None, "5", "12", "123a", "SV001", "SV010", "TG05"]
+
+
+def test_get_set_completion(backend):
+    binder = insert_list("Binder")
+    other = insert_list("Outra")
+    insert_card(binder, "Bulbasaur", "1", "10")
+    insert_card(binder, "Venusaur", "3", "10")
+    insert_card(binder, "Venusaur", "003", "010")
+    insert_card(binder, "Charmander", "7", "10", owned=False)
+    insert_card(binder, "Mew", "TG05", "TG30")
+    insert_card(other, "Charmeleon", "5", "10")
+
+    assert db.get_set_completion(binder) == [
+        ("10", "Inglês", 10, 2, [2, 4, 5, 6, 7, 8, 9, 10], 1),
+        ("TG30", "Inglês", None, 1, [], 0),
+    ]
+    assert db.get_set_completion(None)[0] == ("10", "Inglês", 10, 3, [2, 4, 6, 7, 8, 9, 10], 1)
+
+
+def test_set_completion_gaps(backend):
+    binder = insert_list("Binder")
+    for number in ("1", "2", "3"):
+        insert_card(binder, "Completa", number, "3", language="Japonês")
+    # Números fora da coleção ou não numéricos contam como possuídos, mas não fecham lacunas
+    for number in ("2", "5", "6", "10", "11", "SV1"):
+        insert_card(binder, "Lacunas", number, "10")
+
+    assert db.get_set_completion(binder) == [
+        ("3", "Japonês", 3, 3, [], 0),
+        ("10", "Inglês", 10, 4, [1, 3, 4, 7, 8, 9], 0),
+    ]
+
+
+def test_find_owned_copies(backend):
+    binder = insert_list("Binder")
+    other = insert_list("Outra")
+    wishlist = insert_list("Desejos")
+    insert_card(binder, "Pikachu", "005", "100")
+    insert_card(binder, "Pikachu", "5", "100")
+    insert_card(other, "Pikachu", "5", "100")
+    insert_card(wishlist, "Pikachu", "5", "100", owned=False)
+    insert_card(binder, "Pikachu", "5", "100", card_type="Foil")
+    insert_card(binder, "Pikachu  V", "5", "100")
+    insert_card(other, "ÉEVEE", "SV07", "100", language="Japonês")
+
+    # Caixa, espaços nas pontas e zeros à esquerda não diferenciam o card
+    assert db.find_owned_copies("  PIKACHU ", "0005", "100", "inglês", "normal") == [("Binder", 2), ("Outra", 1)]
+    assert db.find_owned_copies("Pikachu", "5", "100", "Inglês", "Foil") == [("Binder", 1)]
+    assert db.find_owned_copies("Raichu", "5", "100", "Inglês", "Normal") == []
+    # Espaços internos repetidos e maiúsculas acentuadas também não
+    assert db.find_owned_copies("Pikachu V", "5", "100", "Inglês", "Normal") == [("Binder", 1)]
+    assert db.find_owned_copies("Pikachu \t V", "5", "100", "Inglês", "Normal") == [("Binder", 1)]
+    assert db.find_owned_copies("éevee", "sv07", "100", "JAPONÊS", "Normal") == [("Outra", 1)]
+
+
+def test_transfer_cards(backend):
+    binder = insert_list("Binder")
+    target = insert_list("Destino")
+    other = insert_list("Outra")
+    insert_card(target, "Mew", "151")
+    bulbasaur = insert_card(binder, "Bulbasaur", "1", photo_url="https://example.com/bulbasaur.png")
+    insert_card(binder, "Ivysaur", "2")
+    venusaur = insert_card(binder, "Venusaur", "3", photo_url="https://example.com/venusaur.png")
+    stranger = insert_card(other, "Charmander", "4")
+
+    # Cópia: entra depois do maior card_order do destino, na ordem da origem, com a mesma foto
+    assert db.transfer_cards([venusaur, bulbasaur], binder, target, copy=True) == 2
+    assert [(card[1], card[2], card[6]) for card in db.get_cards_for_list(target)] == [
+        ("Mew", "https://example.com/card.png", 1),
+        ("Bulbasaur", "https://example.com/bulbasaur.png", 2),
+        ("Venusaur", "https://example.com/venusaur.png", 3),
+    ]
+    assert [card[1] for card in db.get_cards_for_list(binder)] == ["Bulbasaur", "Ivysaur", "Venusaur"]
+
+    # Movimentação: um card de outra lista no pedido é ignorado
+    assert db.transfer_cards([venusaur, stranger], binder, target) == 1
+    assert [(card[0], card[6]) for card in db.get_cards_for_list(target)][-1] == (venusaur, 4)
+    assert [card[1] for card in db.get_cards_for_list(binder)] == ["Bulbasaur", "Ivysaur"]
+    assert [card[0] for card in db.get_cards_for_list(other)] == [stranger]
+    assert db.transfer_cards([], binder, target) == 0
+
+
+def test_sqlite_memory_url_shares_one_database(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "sqlite:///:memory:")
+    list_id = insert_list("Memória")
+    insert_card(list_id, "Pikachu", "25")
+
+    assert [name for lid, name, _ in db.get_lists_with_counts() if lid == list_id] == ["Memória"]
+    assert [card[1] for card in db.get_cards_for_list(list_id)] == ["Pikachu"]
+
+
+def test_sqlite_schema_works_without_app_functions(sqlite_db):
+    # O arquivo precisa continuar utilizável pelo sqlite3 CLI e ferramentas de backup/inspeção
+    db.get_db_connection().close()
+    conn = sqlite3.connect(sqlite_db)
+    conn.execute("INSERT INTO lists (name) VALUES ('Binder')")
+    conn.execute(
+        "INSERT INTO cards (name, photo_url, card_number, collection_total, language, list_id, card_order, condition, owned, card_type) "
+        "VALUES (' Pikachu  V ', 'u', '005', '010', 'Inglês', 1, 1, 'NM', 1, 'Normal')"
+    )
+    conn.commit()
+
+    assert conn.execute("SELECT identity_key FROM cards").fetchone() == ("pikachu v|5|10|inglês|normal",)
+    assert conn.execute("SELECT collection_total, owned_numbers FROM set_completion WHERE list_id IS NULL").fetchall() == [("10", 1)]
+    conn.close()
+
+
+def test_sqlite_file_from_before_schema_versioning_is_upgraded(sqlite_db):
+    # Arquivo criado pela primeira versão do modo SQLite: chave de identidade via função Python, sem lists.version
+    # e sem photo_checks
+    conn = sqlite3.connect(sqlite_db)
+    conn.create_function("card_identity_key", 5, lambda *parts: "|".join(str(part).lower() for part in parts), deterministic=True)
+    conn.executescript((Path(__file__).parent / "data" / "sqlite_schema_v0.sql").read_text(encoding="utf-8"))
+    conn.execute("INSERT INTO lists (name) VALUES ('Binder')")
+    conn.execute(
+        "INSERT INTO cards (name, photo_url, card_number, collection_total, language, list_id, card_order, condition, owned, card_type) "
+        "VALUES ('Pikachu  V', 'u', '005', '10', 'Inglês', 1, 1, 'NM', 1, 'Normal')"
+    )
+    conn.commit()
+    conn.close()
+
+    assert db.get_list_versions() == [(1, 1)]
+    insert_card(1, "Raichu", "6", "10")
+    assert db.get_list_versions() == [(1, 2)]
+    assert db.find_owned_copies("pikachu v", "5", "10", "Inglês", "Normal") == [("Binder", 1)]
+    assert sorted(row[0] for row in db.search_cards("chu")) == ["Pikachu  V", "Raichu"]
+    assert db.get_set_completion(1)[0][:4] == ("10", "Inglês", 10, 2)
+    assert db.get_broken_photo_urls() == set()
+
+    conn = sqlite3.connect(sqlite_db)
+    assert conn.execute("PRAGMA user_version").fetchone() == (db.SQLITE_SCHEMA_VERSION,)
+    conn.close()
@@ -0,0 +1,118 @@
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import db
+import photo_health
+from conftest import insert_card, insert_list
+
+
+class FakeCloudinary(BaseHTTPRequestHandler):
+    # /ok.png responde ao HEAD; /missing.png não existe; /nohead.png só aceita GET (com Range)
+    range_headers = []
+
+    def do_HEAD(self):
+        if self.path == "/ok.png":
+            self._respond(200, {"Content-Length": "1234"})
+        elif self.path == "/nohead.png":
+            self._respond(405, {"Content-Length": "0"})
+        else:
+            self._respond(404, {"Content-Length": "0"})
+
+    def do_GET(self):
+        if self.path == "/nohead.png":
+            FakeCloudinary.range_headers.append(self.headers.get("Range"))
+            self._respond(206, {"Content-Range": "bytes 0-0/5678", "Content-Length": "1"}, b"x")
+        else:
+            self._respond(404, {"Content-Length": "0"})
+
+    def _respond(self, status, headers, body=b""):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    FakeCloudinary.range_headers = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FakeCloudinary)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def refused_url():
+    # Porta livre sem ninguém escutando
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/gone.png"
+
+
+def photo_checks():
+    conn = db.get_db_connection_readonly()
+    cur = conn.cursor()
+    cur.execute("SELECT photo_url, status_code, content_length, error FROM photo_checks")
+    rows = {row[0]: row[1:] for row in cur.fetchall()}
+    cur.close()
+    conn.close()
+    return rows
+
+
+def scan():
+    return photo_health.scan_photos(workers=4, rate=0, timeout=5)
+
+
+def test_scan_photos_records_status_and_size(sqlite_db, server, refused_url):
+    list_id = insert_list("Binder")
+    for path in ("ok.png", "missing.png", "nohead.png"):
+        insert_card(list_id, path, "1", photo_url=f"{server}/{path}")
+    insert_card(list_id, "gone.png", "1", photo_url=refused_url)
+
+    assert scan() == 4
+    checks = photo_checks()
+    assert checks[f"{server}/ok.png"] == (200, 1234, None)
+    assert checks[f"{server}/missing.png"] == (404, 0, None)
+    # HEAD com 405: repete como GET pedindo só o primeiro byte e usa o total do Content-Range
+    assert checks[f"{server}/nohead.png"] == (206, 5678, None)
+    assert FakeCloudinary.range_headers == ["bytes=0-0"]
+    status_code, content_length, error = checks[refused_url]
+    assert (status_code, content_length) == (None, None) and error
+
+    # Falha de conexão pode ser temporária: só o 404 conta como foto quebrada
+    assert db.get_broken_photo_urls() == {f"{server}/missing.png"}
+
+
+def test_scan_photos_skips_recently_checked(sqlite_db, server):
+    list_id = insert_list("Binder")
+    insert_card(list_id, "ok.png", "1", photo_url=f"{server}/ok.png")
+
+    assert scan() == 1
+    assert scan() == 0
+
+
+def test_malformed_url_is_recorded_as_error(sqlite_db, server):
+    list_id = insert_list("Binder")
+    for url in ("u1", "http://exa mple.com/a b.png"):
+        insert_card(list_id, url, "1", photo_url=url)
+    insert_card(list_id, "ok.png", "1", photo_url=f"{server}/ok.png")
+
+    # Uma URL malformada não interrompe a verificação das demais
+    assert scan() == 3
+    checks = photo_checks()
+    for url in ("u1", "http://exa mple.com/a b.png"):
+        status_code, content_length, error = checks[url]
+        assert (status_code, content_length) == (None, None) and error
+    assert checks[f"{server}/ok.png"] == (200, 1234, None)
+    assert db.get_broken_photo_urls() == set()
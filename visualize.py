@@ -1,148 +1,25 @@
-import os
-import psycopg2
 import streamlit as st
-from dotenv import load_dotenv
+from bootstrap import HIDE_SIDEBAR_NAV_CSS, RESPONSIVE_CSS, setup_page
+from db import (
+    get_db_connection_readonly,
+    get_lists_with_counts,
+    get_cards_for_list,
+    get_all_languages,
+    search_cards,
+    get_set_completion,
+    get_list_version,
+    get_list_versions,
+    get_broken_photo_urls,
+)
 
 # Visualização somente-leitura das listas e cards (100% Streamlit)
 
-load_dotenv()
-st.set_page_config(page_title="Pokélist - Visualização", layout="wide", initial_sidebar_state="collapsed")
-
-
-def get_db_connection_readonly():
-    conn = psycopg2.connect(os.getenv("DATABASE_URL"))
-    try:
-        conn.set_session(readonly=True, autocommit=True)
-    except Exception:
-        with conn.cursor() as cur:
-            cur.execute("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY")
-    return conn
-
-
-def get_lists_with_counts():
-    conn = get_db_connection_readonly()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT l.id, l.name, COUNT(c.id) AS total_cards
-        FROM lists l
-        LEFT JOIN cards c ON c.list_id = l.id
-        GROUP BY l.id, l.name
-        ORDER BY l.name ASC
-        """
-    )
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-    return rows
-
-
-def get_cards_for_list(list_id: int):
-    conn = get_db_connection_readonly()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT id, name, photo_url, card_number, collection_total, language,
-               card_order, grading_note, condition, owned
-        FROM cards
-        WHERE list_id = %s
-        ORDER BY card_order ASC
-        """,
-        (list_id,),
-    )
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-    return rows
-
-def get_all_languages():
-    try:
-        conn = get_db_connection_readonly()
-        cur = conn.cursor()
-        cur.execute("SELECT DISTINCT language FROM cards WHERE language IS NOT NULL AND language <> '' ORDER BY language ASC")
-        langs = [r[0] for r in cur.fetchall()]
-        cur.close()
-        conn.close()
-        return langs
-    except Exception:
-        return []
-
-def search_cards(name_term: str | None, language: str | None, status: str | None, condition: str | None, min_note: int | None, max_note: int | None, sort: str = "name"):
-    # Retorna: name, photo_url, number, total, lang, list_name, card_id, grading_note, condition, owned
-    sql = [
-        """
-        SELECT c.name, c.photo_url, c.card_number, c.collection_total, c.language,
-               l.name as list_name, c.id, c.grading_note, c.condition, c.owned
-        FROM cards c
-        JOIN lists l ON c.list_id = l.id
-        WHERE 1=1
-        """
-    ]
-    params: list = []
-    if name_term:
-        sql.append("AND c.name ILIKE %s")
-        params.append(f"%{name_term}%")
-    if language:
-        sql.append("AND c.language = %s")
-        params.append(language)
-    if status == "owned":
-        sql.append("AND c.owned = TRUE")
-    elif status == "wish":
-        sql.append("AND (c.owned = FALSE OR c.owned IS NULL)")
-    if condition:
-        sql.append("AND c.condition = %s")
-        params.append(condition)
-    if min_note is not None:
-        sql.append("AND c.grading_note >= %s")
-        params.append(min_note)
-    if max_note is not None:
-        sql.append("AND c.grading_note <= %s")
-        params.append(max_note)
-
-    order = "l.name, c.name"
-    if sort == "grade_desc":
-        order = "c.grading_note DESC NULLS LAST, l.name, c.name"
-    elif sort == "name":
-        order = "l.name, c.name"
-    elif sort == "number":
-        order = "l.name, c.card_number, c.name"
-
-    sql.append(f"ORDER BY {order}")
-
-    try:
-        conn = get_db_connection_readonly()
-        cur = conn.cursor()
-        cur.execute("\n".join(sql), tuple(params))
-        rows = cur.fetchall()
-        cur.close()
-        conn.close()
-        return rows
-    except Exception as e:
-        st.error(f"Erro na busca: {e}")
-        return []
-
-
-# Esconde a navegação padrão da pasta pages
-st.markdown(
-    """
-    <style>
-    [data-testid="stSidebarNav"] { display: none !important; }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
-
-st.markdown(
-    """
-    <style>
-    @media (max-width: 900px) {
-        div[data-testid="column"] { width: 100% !important; flex: 1 0 100% !important; min-width: 0 !important; }
-        div[data-testid="stHorizontalBlock"] { gap: 0.5rem !important; }
-        .block-container { padding-left: 0.75rem; padding-right: 0.75rem; }
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
+setup_page(
+    HIDE_SIDEBAR_NAV_CSS,
+    RESPONSIVE_CSS,
+    page_title="Pokélist - Visualização",
+    layout="wide",
+    initial_sidebar_state="collapsed",
 )
 
 
@@ -163,6 +40,16 @@ def _normalize_cloudinary(url: str, width: int = 900, height: int | None = 1200)
         return url
 
 
+def _show_broken_photo(width: int):
+    # Foto marcada como quebrada por photo_health.py: o navegador nem tenta carregá-la
+    height = round(width * 4 / 3)
+    st.markdown(
+        f"<div style='width:{width}px;height:{height}px;display:flex;align-items:center;justify-content:center;"
+        f"border:1px dashed #cbd5e1;border-radius:6px;color:#94a3b8;font-size:0.80rem;'>Imagem indisponível</div>",
+        unsafe_allow_html=True,
+    )
+
+
 def show_lists_view():
     st.title("Listas Públicas")
     st.caption("Selecione uma lista para visualizar os cards.")
@@ -199,6 +86,7 @@ def show_list_detail_view(list_id: int, list_name: str):
         st.rerun()
 
     cards = get_cards_for_list(list_id)
+    broken_photos = get_broken_photo_urls()
     if not cards:
         st.info("Esta lista não possui cards.")
         return
@@ -217,7 +105,10 @@ def show_list_detail_view(list_id: int, list_name: str):
                     # width em pixels para evitar miniaturas no Streamlit Cloud
                     per_row = 4
                     target_w = 420 if per_row <= 2 else (340 if per_row == 3 else 260)
-                    st.image(img_url, width=target_w)
+                    if photo_url in broken_photos:
+                        _show_broken_photo(target_w)
+                    else:
+                        st.image(img_url, width=target_w)
                     st.write(f"**{name}**")
                     meta = []
                     if number:
@@ -243,8 +134,79 @@ def show_list_detail_view(list_id: int, list_name: str):
                         )
 
 
+def _format_missing_numbers(numbers: list[int]) -> str:
+    # Compacta sequências: [1, 2, 3, 7, 9, 10] -> "1-3, 7, 9-10"
+    ranges = []
+    for n in numbers:
+        if ranges and n == ranges[-1][1] + 1:
+            ranges[-1][1] = n
+        else:
+            ranges.append([n, n])
+    return ", ".join(str(a) if a == b else f"{a}-{b}" for a, b in ranges)
+
+
+ALL_LISTS = "todas"
+
+
+@st.cache_data(show_spinner="Calculando a completude...", max_entries=64)
+def _cached_set_completion(list_id: int | None, versions):
+    # versions só compõe a chave do cache: muda a cada alteração de card (lists.version, migration_11.sql)
+    return get_set_completion(list_id)
+
+
+def show_completion_view():
+    st.title("Completude das Coleções")
+    st.caption("Cards na coleção por total da coleção e língua.")
+
+    lists = get_lists_with_counts()
+    options = [ALL_LISTS] + [list_id for list_id, _, _ in lists]
+    names = {list_id: list_name for list_id, list_name, _ in lists}
+    # Sem seleção inicial: o Streamlit executa todas as abas a cada rerun, então nada é calculado
+    # até o usuário escolher o que quer ver
+    selected = st.selectbox(
+        "Lista",
+        options=options,
+        index=None,
+        placeholder="Escolha uma lista ou todas as listas",
+        format_func=lambda v: "Todas as listas" if v == ALL_LISTS else names[v],
+        key="completion_list_id",
+    )
+    if selected is None:
+        return
+
+    try:
+        if selected == ALL_LISTS:
+            rows = _cached_set_completion(None, tuple(get_list_versions()))
+        else:
+            rows = _cached_set_completion(selected, get_list_version(selected))
+    except Exception as e:
+        st.error(f"Erro ao calcular a completude: {e}")
+        return
+    if not rows:
+        st.info("Nenhum card com total da coleção informado.")
+        return
+
+    for collection_total, lang, total_numbers, owned_numbers, missing_numbers, duplicate_count in rows:
+        with st.container(border=True):
+            st.write(f"**Coleção /{collection_total}** • {lang}")
+            if total_numbers:
+                st.progress(min(owned_numbers / total_numbers, 1.0), text=f"{owned_numbers}/{total_numbers}")
+            else:
+                st.caption(f"{owned_numbers} número(s) distinto(s)")
+            info = []
+            if duplicate_count:
+                info.append(f"Repetidos: {duplicate_count}")
+            if missing_numbers:
+                info.append(f"Faltando: {_format_missing_numbers(missing_numbers)}")
+            if info:
+                st.markdown(
+                    f"<div style='font-size:0.78rem;color:#5b6778;'>" + " | ".join(info) + "</div>",
+                    unsafe_allow_html=True,
+                )
+
+
 # --- Roteamento simples por sessão ---
-tab_listas, tab_busca = st.tabs(["Listas", "Buscar"])
+tab_listas, tab_busca, tab_completude = st.tabs(["Listas", "Buscar", "Completude"])
 
 with tab_listas:
     selected_id = st.session_state.get("visualize_selected_list_id")
@@ -283,20 +245,25 @@ with tab_busca:
         submitted = st.form_submit_button("Buscar")
 
     if submitted:
-        results = search_cards(
-            name_term=name_term or None,
-            language=language or None,
-            status=status or None,
-            condition=condition or None,
-            min_note=min_note if min_note else None,
-            max_note=max_note if max_note else None,
-            sort=sort,
-        )
+        try:
+            results = search_cards(
+                name_term=name_term or None,
+                language=language or None,
+                status=status or None,
+                condition=condition or None,
+                min_note=min_note if min_note else None,
+                max_note=max_note if max_note else None,
+                sort=sort,
+            )
+        except Exception as e:
+            st.error(f"Erro na busca: {e}")
+            results = []
 
         if not results:
             st.info("Nenhum card encontrado com os filtros informados.")
         else:
             st.success(f"{len(results)} card(s) encontrado(s)")
+            broken_photos = get_broken_photo_urls()
             cols_per_row = 4
             for i in range(0, len(results), cols_per_row):
                 cols = st.columns(cols_per_row)
@@ -309,7 +276,10 @@ with tab_busca:
                             img_url = _normalize_cloudinary(photo_url, width=900, height=1200)
                             per_row = 4
                             target_w = 420 if per_row <= 2 else (340 if per_row == 3 else 260)
-                            st.image(img_url, width=target_w)
+                            if photo_url in broken_photos:
+                                _show_broken_photo(target_w)
+                            else:
+                                st.image(img_url, width=target_w)
                             st.write(f"**{card_name}**")
                             st.caption(f"Lista: {list_name}")
                             meta = []
@@ -349,3 +319,6 @@ with tab_busca:
                                         st.rerun()
                                 except Exception:
                                     st.warning("Não foi possível abrir a lista.")
+
+with tab_completude:
+    show_completion_view()